@@ -1,11 +1,34 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import random
+import uuid
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
+from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
+
+# Serialize figures with orjson (encodes NumPy arrays natively)
+pio.json.config.default_engine = "orjson"
+
+# ---------- Display Constants ----------
+MONEY_FORMAT = "${:,.2f}"
+MONEY_GRID_FORMATTER = "'$' + value.toLocaleString('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2})"
+MONEY_COLS = (
+    "Max Balance", "Current Balance", "Cash App Sent", "Zelle Sent",
+    "PayPal Sent", "Bank Transfer", "Total Sent"
+)
+LOG_MONEY_COLS = ("Cash App", "Zelle", "PayPal", "Bank Transfer", "Daily Total", "Cumulative Total")
+LOG_METHOD_COLS = ["Cash App", "Zelle", "PayPal", "Bank Transfer"]
+SEARCH_COL = "_search_blob"
+ARROW_STRING = "string[pyarrow]"
+STATUS_COMPLETED_CSS = 'background-color: #d4edda; color: #155724'
+STATUS_PROCESSING_CSS = 'background-color: #fff3cd; color: #856404'
+STATUS_FAILED_CSS = 'background-color: #f8d7da; color: #721c24'
+PAYOUT_STATUSES = ["Confirmed", "Pending", "Processing"]
+PAYOUT_METHODS = ["Cash App", "Zelle", "PayPal", "Bank Transfer"]
+CONFIRMATION_STATUSES = ["Completed", "Processing", "Failed"]
 
 # ---------- Page Configuration ----------
 st.set_page_config(
@@ -15,8 +38,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# ---------- Custom CSS ----------
-st.markdown("""
+# ---------- Static HTML ----------
+_CSS = """
 <style>
     .main-header {
         background: linear-gradient(90deg, #FF6B6B, #4ECDC4);
@@ -49,126 +72,230 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# ---------- Main Header ----------
-st.markdown("""
+_HEADER_HTML = """
 <div class="main-header">
     <h1>🐉 Dragon Dash Sweepstakes Dashboard</h1>
     <p>Complete Account Management & Transaction Tracking System</p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; padding: 2rem; background: linear-gradient(90deg, #FF6B6B, #4ECDC4); color: white; border-radius: 10px; margin-top: 2rem;">
+    <h3>🐉 Dragon Dash Sweepstakes</h3>
+    <p>Professional Dashboard • Real-time Analytics • Secure Transactions</p>
+    <p><em>Last Updated: {}</em></p>
+</div>
+"""
+
+# ---------- Custom CSS ----------
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# ---------- Main Header ----------
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # ---------- Generate Demo Data ----------
+FIRST_NAMES = [
+    "Alexander", "Samantha", "Michael", "Jennifer", "Christopher", "Ashley", 
+    "Matthew", "Jessica", "Andrew", "Sarah", "Joshua", "Amanda", "Daniel", 
+    "Melissa", "David", "Nicole", "James", "Elizabeth", "Robert", "Stephanie"
+]
+
+LAST_NAMES = [
+    "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", 
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", 
+    "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee"
+]
+
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "aol.com"]
+
 @st.cache_data
 def generate_demo_clients(num_clients=20):
     """Generate realistic demo client data"""
-    first_names = [
-        "Alexander", "Samantha", "Michael", "Jennifer", "Christopher", "Ashley", 
-        "Matthew", "Jessica", "Andrew", "Sarah", "Joshua", "Amanda", "Daniel", 
-        "Melissa", "David", "Nicole", "James", "Elizabeth", "Robert", "Stephanie"
-    ]
+    rng = np.random.default_rng(42)  # For consistent demo data
+    now = pd.Timestamp.now()
+    
+    first = rng.choice(FIRST_NAMES, num_clients)
+    last = rng.choice(LAST_NAMES, num_clients)
     
-    last_names = [
-        "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", 
-        "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", 
-        "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee"
-    ]
+    # Generate realistic transaction amounts
+    cash_app = np.where(rng.random(num_clients) > 0.3, rng.uniform(0, 1000, num_clients).round(2), 0.0)
+    zelle = np.where(rng.random(num_clients) > 0.4, rng.uniform(0, 800, num_clients).round(2), 0.0)
+    paypal = np.where(rng.random(num_clients) > 0.2, rng.uniform(0, 1200, num_clients).round(2), 0.0)
+    bank_transfer = np.where(rng.random(num_clients) > 0.6, rng.uniform(0, 2000, num_clients).round(2), 0.0)
     
-    domains = ["gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "aol.com"]
+    total_sent = cash_app + zelle + paypal + bank_transfer
+    max_balance = rng.uniform(500, 5000, num_clients).round(2)
+    current_balance = (max_balance - total_sent + rng.uniform(-200, 500, num_clients)).round(2)
     
-    data = []
-    random.seed(42)  # For consistent demo data
+    # Generate account status
+    verified = rng.random(num_clients) < 0.5
+    payout_status = pd.Categorical(
+        rng.choice(PAYOUT_STATUSES, num_clients), categories=PAYOUT_STATUSES
+    )
+    
+    email_suffix = rng.integers(1, 100, num_clients)
+    email_domain = rng.choice(DOMAINS, num_clients)
+    
+    df = pd.DataFrame({
+        "Client ID": np.char.add("DD-", np.char.zfill((1000 + np.arange(num_clients)).astype(str), 4)),
+        "Name": np.char.add(np.char.add(first, " "), last),
+        "Email": [
+            f"{f.lower()}.{l.lower()}{n}@{d}"
+            for f, l, n, d in zip(first, last, email_suffix, email_domain)
+        ],
+        "Verified": pd.Categorical(
+            np.where(verified, "✅ Verified", "❌ Unverified"),
+            categories=["✅ Verified", "❌ Unverified"]
+        ),
+        "Max Balance": max_balance,
+        "Current Balance": np.maximum(current_balance, 0),
+        "Cash App Sent": cash_app,
+        "Zelle Sent": zelle,
+        "PayPal Sent": paypal,
+        "Bank Transfer": bank_transfer,
+        "Total Sent": total_sent,
+        "Payout Status": payout_status,
+        "Last Activity": (now - pd.to_timedelta(rng.integers(0, 31, num_clients), unit="D")).strftime("%Y-%m-%d"),
+        "Join Date": (now - pd.to_timedelta(rng.integers(30, 366, num_clients), unit="D")).strftime("%Y-%m-%d")
+    })
+    
+    # Arrow-backed strings share one buffer and use Arrow's compiled string kernels
+    df = df.astype({col: ARROW_STRING for col in ("Client ID", "Name", "Email", "Last Activity", "Join Date")})
     
-    for i in range(num_clients):
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        
-        # Generate realistic transaction amounts
-        cash_app = round(random.uniform(0, 1000), 2) if random.random() > 0.3 else 0
-        zelle = round(random.uniform(0, 800), 2) if random.random() > 0.4 else 0
-        paypal = round(random.uniform(0, 1200), 2) if random.random() > 0.2 else 0
-        bank_transfer = round(random.uniform(0, 2000), 2) if random.random() > 0.6 else 0
-        
-        total_sent = cash_app + zelle + paypal + bank_transfer
-        max_balance = round(random.uniform(500, 5000), 2)
-        current_balance = round(max_balance - total_sent + random.uniform(-200, 500), 2)
-        
-        # Generate account status
-        verified = random.choice([True, False])
-        payout_status = random.choice(["Confirmed", "Pending", "Processing"])
-        
-        data.append({
-            "Client ID": f"DD-{1000 + i:04d}",
-            "Name": f"{first_name} {last_name}",
-            "Email": f"{first_name.lower()}.{last_name.lower()}{random.randint(1,99)}@{random.choice(domains)}",
-            "Verified": "✅ Verified" if verified else "❌ Unverified",
-            "Max Balance": max_balance,
-            "Current Balance": max(current_balance, 0),
-            "Cash App Sent": cash_app,
-            "Zelle Sent": zelle,
-            "PayPal Sent": paypal,
-            "Bank Transfer": bank_transfer,
-            "Total Sent": total_sent,
-            "Payout Status": payout_status,
-            "Last Activity": (datetime.now() - timedelta(days=random.randint(0, 30))).strftime("%Y-%m-%d"),
-            "Join Date": (datetime.now() - timedelta(days=random.randint(30, 365))).strftime("%Y-%m-%d")
-        })
+    # Lowercased name + email so search is a single regex-free scan
+    df[SEARCH_COL] = (df["Name"] + "\x00" + df["Email"]).str.lower()
     
-    return pd.DataFrame(data)
+    return df
 
 @st.cache_data
 def generate_daily_logs(num_days=30):
     """Generate daily transaction logs"""
-    logs = []
-    total_cumulative = 0
+    rng = np.random.default_rng(42)
+    dates = pd.Timestamp.now().normalize() - pd.to_timedelta(np.arange(num_days - 1, -1, -1), unit="D")
     
-    for day in range(num_days):
-        date = (datetime.now() - timedelta(days=num_days - day - 1)).strftime("%Y-%m-%d")
-        
-        # Generate realistic daily amounts
-        cash_app_daily = round(random.uniform(200, 1500), 2)
-        zelle_daily = round(random.uniform(150, 1200), 2)
-        paypal_daily = round(random.uniform(300, 2000), 2)
-        bank_daily = round(random.uniform(100, 800), 2)
-        
-        daily_total = cash_app_daily + zelle_daily + paypal_daily + bank_daily
-        total_cumulative += daily_total
-        
-        logs.append({
-            "Date": date,
-            "Cash App": cash_app_daily,
-            "Zelle": zelle_daily,
-            "PayPal": paypal_daily,
-            "Bank Transfer": bank_daily,
-            "Daily Total": daily_total,
-            "Cumulative Total": total_cumulative,
-            "Transactions": random.randint(5, 25)
-        })
+    # Generate realistic daily amounts
+    cash_app_daily = rng.uniform(200, 1500, num_days).round(2)
+    zelle_daily = rng.uniform(150, 1200, num_days).round(2)
+    paypal_daily = rng.uniform(300, 2000, num_days).round(2)
+    bank_daily = rng.uniform(100, 800, num_days).round(2)
     
-    return pd.DataFrame(logs)
+    daily_total = cash_app_daily + zelle_daily + paypal_daily + bank_daily
+    
+    return pd.DataFrame({
+        "Date": dates,
+        "Cash App": cash_app_daily,
+        "Zelle": zelle_daily,
+        "PayPal": paypal_daily,
+        "Bank Transfer": bank_daily,
+        "Daily Total": daily_total,
+        "Cumulative Total": np.cumsum(daily_total),
+        "Transactions": rng.integers(5, 26, num_days)
+    })
 
 @st.cache_data
-def generate_payout_confirmations():
+def generate_payout_confirmations(num_payouts=15):
     """Generate payout confirmation data"""
-    confirmations = []
+    rng = np.random.default_rng(42)
+    dates = pd.Timestamp.now() - pd.to_timedelta(rng.integers(0, 15, num_payouts), unit="D")
+    
+    return pd.DataFrame({
+        "Confirmation ID": np.char.add("PAY-", rng.integers(10000, 100000, num_payouts).astype(str)),
+        "Amount": rng.uniform(50, 2000, num_payouts).round(2),
+        "Method": pd.Categorical(rng.choice(PAYOUT_METHODS, num_payouts), categories=PAYOUT_METHODS),
+        "Status": pd.Categorical(rng.choice(CONFIRMATION_STATUSES, num_payouts), categories=CONFIRMATION_STATUSES),
+        "Date": dates.strftime("%Y-%m-%d %H:%M"),
+        "Client ID": np.char.add("DD-", rng.integers(1000, 1020, num_payouts).astype(str))
+    })
+
+# ---------- Filter Helpers ----------
+# Frames are passed unhashed (leading underscore) and keyed instead on the
+# session's data version, which changes whenever the data is regenerated.
+# Versions are unique per session, so bound the cache size.
+_FILTER_CACHE_ENTRIES = 256
+
+@st.cache_data(show_spinner=False, max_entries=_FILTER_CACHE_ENTRIES)
+def apply_client_filters(_df, data_version, verification, payout, lo, hi, search=""):
+    """Filter client data by sidebar selections and an optional search term"""
+    # AND raw NumPy masks together and slice once at the end
+    balance = _df["Current Balance"].values
+    mask = (balance >= lo) & (balance <= hi)
+    
+    if verification != "All":
+        mask &= _df["Verified"].values == verification
     
-    for i in range(15):
-        confirmation_id = f"PAY-{random.randint(10000, 99999)}"
-        amount = round(random.uniform(50, 2000), 2)
-        method = random.choice(["Cash App", "Zelle", "PayPal", "Bank Transfer"])
-        status = random.choice(["Completed", "Processing", "Failed"])
-        
-        confirmations.append({
-            "Confirmation ID": confirmation_id,
-            "Amount": amount,
-            "Method": method,
-            "Status": status,
-            "Date": (datetime.now() - timedelta(days=random.randint(0, 14))).strftime("%Y-%m-%d %H:%M"),
-            "Client ID": f"DD-{random.randint(1000, 1019):04d}"
-        })
+    if payout != "All":
+        mask &= _df["Payout Status"].values == payout
     
-    return pd.DataFrame(confirmations)
+    if search:
+        needle = search.lower()
+        mask &= _df[SEARCH_COL].str.contains(needle, regex=False, na=False).to_numpy(dtype=bool)
+    
+    return _df.iloc[mask]
+
+@st.cache_data(show_spinner=False, max_entries=_FILTER_CACHE_ENTRIES)
+def apply_log_filter(_df, data_version, start, end):
+    """Filter daily logs to an inclusive date range"""
+    mask = _df["Date"].between(pd.Timestamp(start), pd.Timestamp(end))
+    return _df.loc[mask]
+
+@st.cache_data(show_spinner=False, max_entries=_FILTER_CACHE_ENTRIES)
+def apply_payout_filter(_df, data_version, status):
+    """Filter payout confirmations by status"""
+    if status == "All":
+        return _df
+    return _df.loc[_df["Status"] == status]
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    """Encode client data as CSV bytes for download"""
+    return df.drop(columns=[SEARCH_COL]).to_csv(index=False).encode()
+
+# ---------- Chart Builders ----------
+# Filtered logs are fresh frames on every rerun, so key figures on the date
+# span they cover rather than on identity or full content.
+_LOG_SPAN_HASH_FUNCS = {pd.DataFrame: lambda df: (len(df), df["Date"].min(), df["Date"].max())}
+
+@st.cache_data(show_spinner=False, hash_funcs=_LOG_SPAN_HASH_FUNCS)
+def build_trend_fig(df):
+    """Build the daily and cumulative transaction trend chart"""
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Daily Transaction Amounts', 'Cumulative Totals'),
+        vertical_spacing=0.1
+    )
+    
+    # Daily amounts
+    fig.add_trace(
+        go.Scattergl(x=df["Date"], y=df["Daily Total"],
+                    mode='lines+markers', name='Daily Total', line=dict(color='#4ECDC4')),
+        row=1, col=1
+    )
+    
+    # Cumulative totals
+    fig.add_trace(
+        go.Scattergl(x=df["Date"], y=df["Cumulative Total"],
+                    mode='lines', name='Cumulative Total', line=dict(color='#FF6B6B')),
+        row=2, col=1
+    )
+    
+    fig.update_layout(height=600, showlegend=True)
+    fig.update_xaxes(title_text="Date")
+    fig.update_yaxes(title_text="Amount ($)", row=1, col=1)
+    fig.update_yaxes(title_text="Cumulative Amount ($)", row=2, col=1)
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_pie_fig(payment_methods):
+    """Build the payment method distribution pie chart from per-method totals"""
+    return px.pie(
+        values=payment_methods.values,
+        names=payment_methods.index,
+        title="Payment Method Distribution",
+        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
+    )
 
 # ---------- Load Data ----------
 if 'client_data' not in st.session_state:
@@ -177,10 +304,14 @@ if 'daily_logs' not in st.session_state:
     st.session_state.daily_logs = generate_daily_logs()
 if 'payout_confirmations' not in st.session_state:
     st.session_state.payout_confirmations = generate_payout_confirmations()
+if 'data_version' not in st.session_state:
+    st.session_state.data_version = uuid.uuid4().hex
 
 client_df = st.session_state.client_data
 logs_df = st.session_state.daily_logs
 payouts_df = st.session_state.payout_confirmations
+data_version = st.session_state.data_version
+max_bal = int(client_df["Current Balance"].max())
 
 # ---------- Sidebar Filters ----------
 st.sidebar.title("🔍 Dashboard Filters")
@@ -202,8 +333,8 @@ payout_filter = st.sidebar.selectbox(
 balance_range = st.sidebar.slider(
     "Current Balance Range",
     min_value=0,
-    max_value=int(client_df["Current Balance"].max()),
-    value=(0, int(client_df["Current Balance"].max())),
+    max_value=max_bal,
+    value=(0, max_bal),
     step=100
 )
 
@@ -216,63 +347,30 @@ date_range = st.sidebar.date_input(
 )
 
 # Apply filters
-filtered_df = client_df.copy()
-
-if verification_filter != "All":
-    filtered_df = filtered_df[filtered_df["Verified"] == verification_filter]
-
-if payout_filter != "All":
-    filtered_df = filtered_df[filtered_df["Payout Status"] == payout_filter]
-
-filtered_df = filtered_df[
-    (filtered_df["Current Balance"] >= balance_range[0]) &
-    (filtered_df["Current Balance"] <= balance_range[1])
-]
+filtered_df = apply_client_filters(
+    client_df, data_version, verification_filter, payout_filter, balance_range[0], balance_range[1]
+)
 
 # ---------- Main Dashboard ----------
 
 # Key Metrics Row
-col1, col2, col3, col4, col5 = st.columns(5)
-
-with col1:
-    st.metric(
-        "👥 Total Clients",
-        len(filtered_df),
-        delta=f"{len(filtered_df) - len(client_df) + len(filtered_df)} filtered"
-    )
-
-with col2:
-    total_sent = filtered_df["Total Sent"].sum()
-    st.metric(
-        "💸 Total Sent",
-        f"${total_sent:,.2f}",
-        delta=f"${total_sent/len(filtered_df):,.2f} avg" if len(filtered_df) > 0 else "N/A"
-    )
-
-with col3:
-    total_balance = filtered_df["Current Balance"].sum()
-    st.metric(
-        "💰 Total Balance",
-        f"${total_balance:,.2f}",
-        delta=f"${total_balance/len(filtered_df):,.2f} avg" if len(filtered_df) > 0 else "N/A"
-    )
-
-with col4:
-    verified_count = len(filtered_df[filtered_df["Verified"] == "✅ Verified"])
-    verification_rate = (verified_count / len(filtered_df) * 100) if len(filtered_df) > 0 else 0
-    st.metric(
-        "✅ Verified Rate",
-        f"{verification_rate:.1f}%",
-        delta=f"{verified_count}/{len(filtered_df)}"
-    )
-
-with col5:
-    confirmed_payouts = len(payouts_df[payouts_df["Status"] == "Completed"])
-    st.metric(
-        "✅ Confirmed Payouts",
-        confirmed_payouts,
-        delta=f"{len(payouts_df)} total"
-    )
+n = len(filtered_df)
+n_total = len(client_df)
+total_sent = filtered_df["Total Sent"].sum()
+total_balance = filtered_df["Current Balance"].sum()
+verified_count = int((filtered_df["Verified"].values == "✅ Verified").sum())
+verification_rate = (verified_count / n * 100) if n else 0
+confirmed_payouts = int(payouts_df["Status"].eq("Completed").sum())
+
+metrics = [
+    ("👥 Total Clients", n, f"{n_total - n} filtered"),
+    ("💸 Total Sent", f"${total_sent:,.2f}", f"${total_sent/n:,.2f} avg" if n else "N/A"),
+    ("💰 Total Balance", f"${total_balance:,.2f}", f"${total_balance/n:,.2f} avg" if n else "N/A"),
+    ("✅ Verified Rate", f"{verification_rate:.1f}%", f"{verified_count}/{n}"),
+    ("✅ Confirmed Payouts", confirmed_payouts, f"{len(payouts_df)} total"),
+]
+for col, (label, value, delta) in zip(st.columns(len(metrics)), metrics):
+    col.metric(label, value, delta=delta)
 
 st.markdown("---")
 
@@ -283,43 +381,38 @@ st.subheader("📋 Client Account Overview")
 search_term = st.text_input("🔍 Search clients by name or email:", placeholder="Enter name or email...")
 
 if search_term:
-    filtered_df = filtered_df[
-        filtered_df["Name"].str.contains(search_term, case=False, na=False) |
-        filtered_df["Email"].str.contains(search_term, case=False, na=False)
-    ]
-
-# Format the dataframe for better display
-display_df = filtered_df.copy()
-display_df["Max Balance"] = display_df["Max Balance"].apply(lambda x: f"${x:,.2f}")
-display_df["Current Balance"] = display_df["Current Balance"].apply(lambda x: f"${x:,.2f}")
-display_df["Cash App Sent"] = display_df["Cash App Sent"].apply(lambda x: f"${x:,.2f}")
-display_df["Zelle Sent"] = display_df["Zelle Sent"].apply(lambda x: f"${x:,.2f}")
-display_df["PayPal Sent"] = display_df["PayPal Sent"].apply(lambda x: f"${x:,.2f}")
-display_df["Bank Transfer"] = display_df["Bank Transfer"].apply(lambda x: f"${x:,.2f}")
-display_df["Total Sent"] = display_df["Total Sent"].apply(lambda x: f"${x:,.2f}")
+    filtered_df = apply_client_filters(
+        client_df, data_version, verification_filter, payout_filter,
+        balance_range[0], balance_range[1], search_term
+    )
 
-st.dataframe(
-    display_df,
-    use_container_width=True,
+# Client-side grid: column filters and sorting run in the browser without a rerun
+grid_df = filtered_df.drop(columns=[SEARCH_COL])
+gob = GridOptionsBuilder.from_dataframe(grid_df)
+gob.configure_default_column(filterable=True, sortable=True, resizable=True, floatingFilter=True)
+gob.configure_column("Client ID", width=100)
+gob.configure_column("Name", width=160)
+gob.configure_column("Email", width=240)
+gob.configure_column("Verified", width=100)
+gob.configure_column("Payout Status", header_name="Status", width=100)
+for col in MONEY_COLS:
+    gob.configure_column(col, type=["numericColumn", "numberColumnFilter"], valueFormatter=MONEY_GRID_FORMATTER)
+
+AgGrid(
+    grid_df,
+    gridOptions=gob.build(),
+    update_mode=GridUpdateMode.NO_UPDATE,
     height=400,
-    column_config={
-        "Client ID": st.column_config.TextColumn("Client ID", width="small"),
-        "Name": st.column_config.TextColumn("Name", width="medium"),
-        "Email": st.column_config.TextColumn("Email", width="large"),
-        "Verified": st.column_config.TextColumn("Verified", width="small"),
-        "Payout Status": st.column_config.TextColumn("Status", width="small"),
-    }
+    key="clients"
 )
 
 # Export functionality
-if st.button("📥 Export Client Data"):
-    csv = filtered_df.to_csv(index=False)
-    st.download_button(
-        label="Download CSV",
-        data=csv,
-        file_name=f"dragon_dash_clients_{datetime.now().strftime('%Y%m%d')}.csv",
-        mime="text/csv"
-    )
+st.download_button(
+    label="📥 Export Client Data",
+    data=to_csv_bytes(filtered_df),
+    file_name=f"dragon_dash_clients_{datetime.now().strftime('%Y%m%d')}.csv",
+    mime="text/csv"
+)
 
 st.markdown("---")
 
@@ -329,10 +422,7 @@ st.subheader("📊 Daily Transaction Analytics")
 # Filter logs by date range
 if len(date_range) == 2:
     start_date, end_date = date_range
-    logs_filtered = logs_df[
-        (pd.to_datetime(logs_df["Date"]) >= pd.to_datetime(start_date)) &
-        (pd.to_datetime(logs_df["Date"]) <= pd.to_datetime(end_date))
-    ]
+    logs_filtered = apply_log_filter(logs_df, data_version, start_date, end_date)
 else:
     logs_filtered = logs_df
 
@@ -341,38 +431,13 @@ tab1, tab2, tab3 = st.tabs(["📈 Trends", "📋 Daily Logs", "💳 Payment Meth
 
 with tab1:
     # Transaction trends chart
-    fig = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=('Daily Transaction Amounts', 'Cumulative Totals'),
-        vertical_spacing=0.1
-    )
-    
-    # Daily amounts
-    fig.add_trace(
-        go.Scatter(x=logs_filtered["Date"], y=logs_filtered["Daily Total"],
-                  mode='lines+markers', name='Daily Total', line=dict(color='#4ECDC4')),
-        row=1, col=1
-    )
-    
-    # Cumulative totals
-    fig.add_trace(
-        go.Scatter(x=logs_filtered["Date"], y=logs_filtered["Cumulative Total"],
-                  mode='lines', name='Cumulative Total', line=dict(color='#FF6B6B')),
-        row=2, col=1
-    )
-    
-    fig.update_layout(height=600, showlegend=True)
-    fig.update_xaxes(title_text="Date")
-    fig.update_yaxes(title_text="Amount ($)", row=1, col=1)
-    fig.update_yaxes(title_text="Cumulative Amount ($)", row=2, col=1)
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_trend_fig(logs_filtered), use_container_width=True)
 
 with tab2:
     # Daily logs table
-    logs_display = logs_filtered.copy()
-    for col in ["Cash App", "Zelle", "PayPal", "Bank Transfer", "Daily Total", "Cumulative Total"]:
-        logs_display[col] = logs_display[col].apply(lambda x: f"${x:,.2f}")
+    logs_display = logs_filtered.style.format(
+        {"Date": "{:%Y-%m-%d}", **{col: MONEY_FORMAT for col in LOG_MONEY_COLS}}
+    )
     
     st.dataframe(logs_display, use_container_width=True, height=400)
     
@@ -389,22 +454,10 @@ with tab2:
 
 with tab3:
     # Payment method breakdown
-    payment_methods = {
-        "Cash App": logs_filtered["Cash App"].sum(),
-        "Zelle": logs_filtered["Zelle"].sum(),
-        "PayPal": logs_filtered["PayPal"].sum(),
-        "Bank Transfer": logs_filtered["Bank Transfer"].sum()
-    }
+    payment_methods = logs_filtered[LOG_METHOD_COLS].sum()
     
     # Pie chart for payment methods
-    fig = px.pie(
-        values=list(payment_methods.values()),
-        names=list(payment_methods.keys()),
-        title="Payment Method Distribution",
-        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_pie_fig(payment_methods), use_container_width=True)
     
     # Payment method metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -433,28 +486,25 @@ with col1:
 with col2:
     if st.button("🔄 Refresh Payouts"):
         st.session_state.payout_confirmations = generate_payout_confirmations()
+        st.session_state.data_version = uuid.uuid4().hex
         st.rerun()
 
 # Filter payouts
-filtered_payouts = payouts_df.copy()
-if payout_status_filter != "All":
-    filtered_payouts = filtered_payouts[filtered_payouts["Status"] == payout_status_filter]
-
-# Format payout data
-filtered_payouts["Amount"] = filtered_payouts["Amount"].apply(lambda x: f"${x:,.2f}")
+filtered_payouts = apply_payout_filter(payouts_df, data_version, payout_status_filter)
 
 # Color code status
-def highlight_status(val):
-    if "Completed" in str(val):
-        return 'background-color: #d4edda; color: #155724'
-    elif "Processing" in str(val):
-        return 'background-color: #fff3cd; color: #856404'
-    elif "Failed" in str(val):
-        return 'background-color: #f8d7da; color: #721c24'
-    return ''
+def highlight_status(col):
+    values = col.values
+    return np.select(
+        [values == "Completed", values == "Processing", values == "Failed"],
+        [STATUS_COMPLETED_CSS, STATUS_PROCESSING_CSS, STATUS_FAILED_CSS],
+        default=''
+    )
 
 st.dataframe(
-    filtered_payouts.style.applymap(highlight_status, subset=['Status']),
+    filtered_payouts.style
+        .format({"Amount": MONEY_FORMAT})
+        .apply(highlight_status, axis=0, subset=['Status']),
     use_container_width=True,
     height=300
 )
@@ -462,9 +512,7 @@ st.dataframe(
 # Payout summary
 col1, col2, col3 = st.columns(3)
 with col1:
-    completed_amount = payouts_df[payouts_df["Status"] == "Completed"]["Amount"].apply(
-        lambda x: float(x.replace('$', '').replace(',', '')) if isinstance(x, str) else x
-    ).sum()
+    completed_amount = payouts_df.loc[payouts_df["Status"].eq("Completed"), "Amount"].sum()
     st.metric("✅ Completed Payouts", f"${completed_amount:,.2f}")
 
 with col2:
@@ -478,19 +526,13 @@ with col3:
 st.markdown("---")
 
 # ---------- Footer ----------
-st.markdown("""
-<div style="text-align: center; padding: 2rem; background: linear-gradient(90deg, #FF6B6B, #4ECDC4); color: white; border-radius: 10px; margin-top: 2rem;">
-    <h3>🐉 Dragon Dash Sweepstakes</h3>
-    <p>Professional Dashboard • Real-time Analytics • Secure Transactions</p>
-    <p><em>Last Updated: {}</em></p>
-</div>
-""".format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")), unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")), unsafe_allow_html=True)
 
 # ---------- Sidebar Additional Info ----------
 st.sidebar.markdown("---")
 st.sidebar.subheader("📊 Quick Stats")
-st.sidebar.info(f"**Total Clients:** {len(client_df)}")
-st.sidebar.info(f"**Active Filters:** {len(client_df) - len(filtered_df)} hidden")
+st.sidebar.info(f"**Total Clients:** {n_total}")
+st.sidebar.info(f"**Active Filters:** {n_total - len(filtered_df)} hidden")
 st.sidebar.info(f"**Data Generated:** {datetime.now().strftime('%Y-%m-%d')}")
 
 st.sidebar.markdown("---")
@@ -499,6 +541,7 @@ if st.sidebar.button("🔄 Refresh All Data"):
     st.session_state.client_data = generate_demo_clients()
     st.session_state.daily_logs = generate_daily_logs()
     st.session_state.payout_confirmations = generate_payout_confirmations()
+    st.session_state.data_version = uuid.uuid4().hex
     st.rerun()
 
 if st.sidebar.button("📋 Generate Report"):
@@ -521,6 +564,7 @@ with st.expander("ℹ️ How to Use This Dashboard"):
     - Click on tabs to switch between different analytical views
     - Hover over charts for detailed information
     - Use the search bar to quickly find specific clients
+    - Use the filter boxes under the client table headers to refine rows instantly
     
     **Demo Data**: This dashboard uses realistic demo data for demonstration purposes.
     All client information is fictional and generated for testing purposes only.